@@ -7,4 +7,6 @@ Files:
 - cycles_demo.py: Cycle detection and analysis
 - search_algorithms.py: BFS and DFS implementations
 - complex_graph.py: Complex graph structures and analysis
+
+Set TOPOGRAPH_BENCH=1 to skip printing and plotting when timing the examples.
 """
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Helpers for timing the examples without their output.
+
+Setting TOPOGRAPH_BENCH=1 turns maybe_print and maybe_visualize into
+no-ops, so a timed run measures the algorithms rather than printing and
+matplotlib rendering.
+"""
+import os
+from typing import Any, Callable
+
+
+def bench_mode() -> bool:
+    """Return True when the examples run under TOPOGRAPH_BENCH=1."""
+    return os.getenv("TOPOGRAPH_BENCH") == "1"
+
+
+def maybe_print(*args: Any, **kwargs: Any) -> None:
+    """Print unless running in bench mode."""
+    if not bench_mode():
+        print(*args, **kwargs)
+
+
+def maybe_visualize(fn: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+    """Call a visualize_* function unless running in bench mode."""
+    if not bench_mode():
+        fn(*args, **kwargs)
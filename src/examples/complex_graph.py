@@ -2,6 +2,7 @@ from src.main.algorithms.connectivity import get_connected_components
 from src.main.algorithms.cycles import find_all_cycles
 from src.main.graph import Graph
 from src.main.visualization.plot import visualize_components, visualize_cycle
+from src.examples._bench import maybe_print, maybe_visualize
 
 
 def main():
@@ -30,13 +31,13 @@ def main():
 
     # Analyze the graph
     components = get_connected_components(g)
-    print(f"Number of components: {len(components)}")
-    visualize_components(g, components, "Complex Graph Components")
+    maybe_print(f"Number of components: {len(components)}")
+    maybe_visualize(visualize_components, g, components, "Complex Graph Components")
 
     cycles = find_all_cycles(g)
-    print(f"Number of cycles: {len(cycles)}")
+    maybe_print(f"Number of cycles: {len(cycles)}")
     for i, cycle in enumerate(cycles[:3]):  # Show first 3 cycles
-        visualize_cycle(g, cycle, f"Complex Graph Cycle {i + 1}")
+        maybe_visualize(visualize_cycle, g, cycle, f"Complex Graph Cycle {i + 1}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 from src.main.graph import Graph
 from src.main.algorithms.cycles import has_cycle, find_cycle, find_all_cycles, get_cycle_basis
 from src.main.visualization.plot import visualize_cycle
+from src.examples._bench import maybe_print, maybe_visualize
 
 
 def main():
@@ -14,23 +15,23 @@ def main():
     g.add_edge(4, 1)  # Second cycle
 
     # Check for cycles
-    print(f"Graph has cycles: {has_cycle(g)}")
+    maybe_print(f"Graph has cycles: {has_cycle(g)}")
 
     # Find a single cycle
     cycle = find_cycle(g)
     if cycle:
-        print(f"Found cycle: {cycle}")
-        visualize_cycle(g, cycle, "Single Cycle")
+        maybe_print(f"Found cycle: {cycle}")
+        maybe_visualize(visualize_cycle, g, cycle, "Single Cycle")
 
     # Find all cycles
     all_cycles = find_all_cycles(g)
-    print(f"All cycles in graph: {all_cycles}")
+    maybe_print(f"All cycles in graph: {all_cycles}")
     for i, cycle in enumerate(all_cycles):
-        visualize_cycle(g, cycle, f"Cycle {i + 1}")
+        maybe_visualize(visualize_cycle, g, cycle, f"Cycle {i + 1}")
 
     # Get cycle basis
     basis = get_cycle_basis(g)
-    print(f"Cycle basis: {basis}")
+    maybe_print(f"Cycle basis: {basis}")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ from src.main.algorithms.search import (
     find_path_bfs, find_all_paths_dfs, get_search_tree
 )
 from src.main.visualization.plot import visualize_graph, visualize_path
+from src.examples._bench import maybe_print, maybe_visualize
 
 
 def main():
@@ -18,32 +19,32 @@ def main():
 
     # Perform BFS
     bfs_result = breadth_first_search(g, 1)
-    print("BFS Results:")
-    print(f"Visit order: {bfs_result['visited_order']}")
-    print(f"Distances: {bfs_result['distances']}")
-    print(f"Predecessors: {bfs_result['predecessors']}")
+    maybe_print("BFS Results:")
+    maybe_print(f"Visit order: {bfs_result['visited_order']}")
+    maybe_print(f"Distances: {bfs_result['distances']}")
+    maybe_print(f"Predecessors: {bfs_result['predecessors']}")
 
     # Perform DFS
     dfs_result = depth_first_search(g, 1)
-    print("\nDFS Results:")
-    print(f"Visit order: {dfs_result['visited_order']}")
-    print(f"Discovery times: {dfs_result['discovery_times']}")
-    print(f"Finish times: {dfs_result['finish_times']}")
+    maybe_print("\nDFS Results:")
+    maybe_print(f"Visit order: {dfs_result['visited_order']}")
+    maybe_print(f"Discovery times: {dfs_result['discovery_times']}")
+    maybe_print(f"Finish times: {dfs_result['finish_times']}")
 
     # Find paths
     bfs_path = find_path_bfs(g, 1, 5)
-    print(f"\nShortest path (BFS) from 1 to 5: {bfs_path}")
+    maybe_print(f"\nShortest path (BFS) from 1 to 5: {bfs_path}")
     if bfs_path:
-        visualize_path(g, bfs_path, "Shortest Path (BFS)")
+        maybe_visualize(visualize_path, g, bfs_path, "Shortest Path (BFS)")
 
-    all_paths = find_all_paths_dfs(g, 1, 5)
-    print(f"All paths (DFS) from 1 to 5: {all_paths}")
+    all_paths = list(find_all_paths_dfs(g, 1, 5))
+    maybe_print(f"All paths (DFS) from 1 to 5: {all_paths}")
     for i, path in enumerate(all_paths):
-        visualize_path(g, path, f"Path {i + 1} (DFS)")
+        maybe_visualize(visualize_path, g, path, f"Path {i + 1} (DFS)")
 
     # Visualize search tree
     bfs_tree = get_search_tree(bfs_result['predecessors'])
-    visualize_graph(g, title="BFS Tree",
+    maybe_visualize(visualize_graph, g, title="BFS Tree",
                     highlight_edges=[(p, c) for p, children in bfs_tree.items()
                                      for c in children])
 
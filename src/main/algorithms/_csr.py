@@ -0,0 +1,154 @@
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+from src.main.graph import Graph
+
+
+def _snapshot(graph: Graph) -> Tuple[List[Any], Dict[Any, int], array, array]:
+    """
+    Return the graph's cached CSR view in the order the algorithms unpack it.
+
+    Returns:
+        A tuple (vertices, vid, indptr, indices) where vertices maps integer
+        ids back to vertices and vid maps vertices to their integer ids.
+        They are shared with the graph's cache and must not be modified.
+    """
+    indptr, indices, vid, vertices = graph.freeze()
+    return vertices, vid, indptr, indices
+
+
+# Sentinel returned by next() once a vertex's neighbors are exhausted
+_DONE = object()
+
+# Graphs with more vertices than this use direction-optimizing BFS
+_DIRECTION_OPTIMIZING_THRESHOLD = 1024
+
+# Switch to bottom-up once the frontier has more than 1/_ALPHA of the
+# edges still incident to unvisited vertices
+_ALPHA = 14
+
+
+def _bfs(indptr: array, indices: array, start: int,
+         visited: bytearray, predecessors: array) -> Sequence[int]:
+    """
+    Breadth-first search over a CSR snapshot.
+
+    Marks every vertex reachable from start in visited, records its BFS
+    parent in predecessors and returns the vertex ids in visiting order.
+    Large graphs use direction-optimizing BFS, which expands dense levels
+    bottom-up from the unvisited vertices instead of from the frontier.
+    """
+    visited[start] = 1
+    if len(indptr) - 1 > _DIRECTION_OPTIMIZING_THRESHOLD:
+        return _bfs_direction_optimizing(indptr, indices, start, visited, predecessors)
+
+    # Each vertex is enqueued at most once, so the queue never wraps and
+    # its filled prefix is the visiting order
+    queue = array('i', [0]) * (len(indptr) - 1)
+    queue[0] = start
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        for j in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[j]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                predecessors[neighbor] = current
+                queue[tail] = neighbor
+                tail += 1
+
+    return queue[:tail]
+
+
+def _dfs(indptr: array, indices: array, start: int):
+    """
+    Depth-first search over a CSR snapshot.
+
+    Returns (order, discovery, finished, finish, predecessors): vertex ids
+    in discovery order, discovery times, vertex ids in finishing order,
+    finish times and DFS parents. Times start at 1.
+    """
+    n = len(indptr) - 1
+    discovery = array('i', [0]) * n
+    finish = array('i', [0]) * n
+    predecessors = array('i', [-1]) * n
+    cursor = indptr[:-1]
+    order = [start]
+    finished = []
+    time = 1
+    discovery[start] = time
+    stack = [start]
+
+    while stack:
+        vertex = stack[-1]
+        j = cursor[vertex]
+
+        if j == indptr[vertex + 1]:
+            stack.pop()
+            time += 1
+            finish[vertex] = time
+            finished.append(vertex)
+            continue
+
+        cursor[vertex] = j + 1
+        neighbor = indices[j]
+        if not discovery[neighbor]:
+            time += 1
+            discovery[neighbor] = time
+            predecessors[neighbor] = vertex
+            order.append(neighbor)
+            stack.append(neighbor)
+
+    return order, discovery, finished, finish, predecessors
+
+
+def _bfs_direction_optimizing(indptr: array, indices: array, start: int,
+                              visited: bytearray, predecessors: array) -> Sequence[int]:
+    """Helper function running level-synchronous top-down/bottom-up BFS."""
+    n = len(indptr) - 1
+    # Levels are written to order back to back; the frontier is order[lo:hi]
+    order = array('i', [0]) * n
+    order[0] = start
+    lo, hi = 0, 1
+    in_frontier = bytearray(n)
+    in_frontier[start] = 1
+    unexplored_edges = len(indices) - (indptr[start + 1] - indptr[start])
+
+    while lo < hi:
+        frontier_edges = sum(indptr[order[i] + 1] - indptr[order[i]] for i in range(lo, hi))
+        tail = hi
+
+        if frontier_edges > unexplored_edges / _ALPHA:
+            # Bottom-up: each unvisited vertex looks for a parent in the frontier
+            for v in range(n):
+                if not visited[v]:
+                    for j in range(indptr[v], indptr[v + 1]):
+                        u = indices[j]
+                        if in_frontier[u]:
+                            visited[v] = 1
+                            predecessors[v] = u
+                            order[tail] = v
+                            tail += 1
+                            break
+        else:
+            for i in range(lo, hi):
+                u = order[i]
+                for j in range(indptr[u], indptr[u + 1]):
+                    v = indices[j]
+                    if not visited[v]:
+                        visited[v] = 1
+                        predecessors[v] = u
+                        order[tail] = v
+                        tail += 1
+
+        for i in range(lo, hi):
+            in_frontier[order[i]] = 0
+        for i in range(hi, tail):
+            v = order[i]
+            in_frontier[v] = 1
+            unexplored_edges -= indptr[v + 1] - indptr[v]
+
+        lo, hi = hi, tail
+
+    return order[:hi]
@@ -0,0 +1,108 @@
+from array import array
+from typing import List, Set
+
+
+def johnson_all_cycles(indptr: array, indices: array, n: int) -> List[List[int]]:
+    """
+    Enumerate the simple cycles of an undirected CSR graph with Johnson's algorithm.
+
+    Each edge is treated as a pair of opposite arcs. For every start vertex
+    s the search is confined to the component of s in the subgraph induced
+    by the ids s..n-1, so every cycle is found from its smallest vertex.
+    Blocked vertices are only released once a circuit through them is
+    found, which bounds the work at O((V + E)(C + 1)) for C circuits.
+    Two-vertex circuits (an edge and its reverse) only drive unblocking,
+    and of the two orientations of a longer cycle only the one whose
+    second vertex is smaller than its last is emitted.
+
+    Returns:
+        Cycles as lists of vertex ids, each starting at its smallest id.
+    """
+    cycles = []
+    blocked = bytearray(n)
+    in_component = bytearray(n)
+    B: List[Set[int]] = [set() for _ in range(n)]
+
+    for start in range(n):
+        component = _component_from(indptr, indices, start, in_component)
+        if len(component) >= 3:
+            _circuits_from(indptr, indices, start, in_component, blocked, B, cycles)
+
+        for v in component:
+            in_component[v] = 0
+            blocked[v] = 0
+            B[v].clear()
+
+    return cycles
+
+
+def _component_from(indptr: array, indices: array, start: int,
+                    in_component: bytearray) -> List[int]:
+    """Helper function to mark the component of start among ids >= start."""
+    in_component[start] = 1
+    component = [start]
+    head = 0
+
+    while head < len(component):
+        current = component[head]
+        head += 1
+        for j in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[j]
+            if neighbor > start and not in_component[neighbor]:
+                in_component[neighbor] = 1
+                component.append(neighbor)
+
+    return component
+
+
+def _circuits_from(indptr: array, indices: array, start: int, in_component: bytearray,
+                   blocked: bytearray, B: List[Set[int]], cycles: List[List[int]]) -> None:
+    """Helper function to emit the cycles through start within its component."""
+    path = [start]
+    blocked[start] = 1
+    # Each frame is (vertex, edge cursor, whether a circuit was found below it)
+    stack = [[start, indptr[start], 0]]
+
+    while stack:
+        frame = stack[-1]
+        vertex, j = frame[0], frame[1]
+
+        if j < indptr[vertex + 1]:
+            frame[1] = j + 1
+            neighbor = indices[j]
+            if not in_component[neighbor]:
+                continue
+
+            if neighbor == start:
+                if len(path) > 2 and path[1] < path[-1]:
+                    cycles.append(path[:])
+                frame[2] = 1
+            elif not blocked[neighbor]:
+                path.append(neighbor)
+                blocked[neighbor] = 1
+                stack.append([neighbor, indptr[neighbor], 0])
+            continue
+
+        # All arcs out of vertex are explored
+        stack.pop()
+        path.pop()
+        if frame[2]:
+            _unblock(vertex, blocked, B)
+            if stack:
+                stack[-1][2] = 1
+        else:
+            for k in range(indptr[vertex], indptr[vertex + 1]):
+                neighbor = indices[k]
+                if in_component[neighbor]:
+                    B[neighbor].add(vertex)
+
+
+def _unblock(vertex: int, blocked: bytearray, B: List[Set[int]]) -> None:
+    """Helper function to unblock vertex and, transitively, the vertices waiting on it."""
+    stack = [vertex]
+    while stack:
+        current = stack.pop()
+        if blocked[current]:
+            blocked[current] = 0
+            stack.extend(B[current])
+            B[current].clear()
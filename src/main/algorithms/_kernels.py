@@ -0,0 +1,157 @@
+"""
+Numba-compiled traversal kernels over CSR snapshots.
+
+Numba is optional. When it is not installed HAVE_NUMBA is False and the
+callers fall back to their pure-Python loops.
+"""
+from array import array
+from typing import Tuple
+
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    np = None
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def as_numpy(indptr: array, indices: array) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Wrap CSR arrays as int32 NumPy arrays without copying."""
+    return (np.frombuffer(indptr, dtype=np.int32),
+            np.frombuffer(indices, dtype=np.int32))
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def bfs_csr(indptr, indices, start, n):
+        """Return the BFS visiting order, distances and predecessors from start."""
+        dist = np.full(n, -1, np.int32)
+        pred = np.full(n, -1, np.int32)
+        queue = np.empty(n, np.int32)
+        dist[start] = 0
+        queue[0] = start
+        head, tail = 0, 1
+
+        while head < tail:
+            current = queue[head]
+            head += 1
+            for j in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[j]
+                if dist[neighbor] < 0:
+                    dist[neighbor] = dist[current] + 1
+                    pred[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
+
+        return queue[:tail], dist, pred
+
+    @njit(cache=True)
+    def _bfs_distances(indptr, indices, start, dist, queue):
+        """Fill dist (preset to -1) with BFS distances from start."""
+        dist[start] = 0
+        queue[0] = start
+        head, tail = 0, 1
+
+        while head < tail:
+            current = queue[head]
+            head += 1
+            for j in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[j]
+                if dist[neighbor] < 0:
+                    dist[neighbor] = dist[current] + 1
+                    queue[tail] = neighbor
+                    tail += 1
+
+    @njit(cache=True, parallel=True)
+    def bfs_multi_source(indptr, indices, sources, n):
+        """Return a (len(sources), n) matrix of BFS distances, -1 if unreachable."""
+        dist = np.full((len(sources), n), -1, np.int32)
+        for i in prange(len(sources)):
+            _bfs_distances(indptr, indices, sources[i], dist[i], np.empty(n, np.int32))
+        return dist
+
+    @njit(cache=True)
+    def dfs_csr(indptr, indices, start, n):
+        """
+        Return the DFS discovery order, discovery times, finishing order,
+        finish times and predecessors from start. Times start at 1.
+        """
+        discovery = np.zeros(n, np.int32)
+        finish = np.zeros(n, np.int32)
+        pred = np.full(n, -1, np.int32)
+        cursor = indptr[:-1].copy()
+        stack = np.empty(n, np.int32)
+        order = np.empty(n, np.int32)
+        finished = np.empty(n, np.int32)
+
+        time = 1
+        discovery[start] = time
+        stack[0] = start
+        order[0] = start
+        top, n_order, n_finished = 0, 1, 0
+
+        while top >= 0:
+            vertex = stack[top]
+            j = cursor[vertex]
+            if j == indptr[vertex + 1]:
+                top -= 1
+                time += 1
+                finish[vertex] = time
+                finished[n_finished] = vertex
+                n_finished += 1
+                continue
+
+            cursor[vertex] = j + 1
+            neighbor = indices[j]
+            if discovery[neighbor] == 0:
+                time += 1
+                discovery[neighbor] = time
+                pred[neighbor] = vertex
+                order[n_order] = neighbor
+                n_order += 1
+                top += 1
+                stack[top] = neighbor
+
+        return order[:n_order], discovery, finished[:n_finished], finish, pred
+
+    @njit(cache=True)
+    def has_cycle_csr(indptr, indices, n):
+        """Return True if the undirected graph contains a cycle."""
+        visited = np.zeros(n, np.uint8)
+        on_path = np.zeros(n, np.uint8)
+        parent = np.full(n, -1, np.int32)
+        cursor = np.empty(n, np.int32)
+        stack = np.empty(n, np.int32)
+
+        for root in range(n):
+            if visited[root]:
+                continue
+
+            visited[root] = 1
+            on_path[root] = 1
+            cursor[root] = indptr[root]
+            stack[0] = root
+            top = 0
+
+            while top >= 0:
+                vertex = stack[top]
+                if cursor[vertex] == indptr[vertex + 1]:
+                    on_path[vertex] = 0
+                    top -= 1
+                    continue
+
+                neighbor = indices[cursor[vertex]]
+                cursor[vertex] += 1
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    on_path[neighbor] = 1
+                    parent[neighbor] = vertex
+                    cursor[neighbor] = indptr[neighbor]
+                    top += 1
+                    stack[top] = neighbor
+                elif on_path[neighbor] and neighbor != parent[vertex]:
+                    return True
+
+        return False
@@ -1,93 +1,147 @@
-from typing import List, Set, Dict, Optional, Any
-from collections import deque
+from array import array
+from typing import List, Set, Optional, Any, Sequence, Mapping, Union
 from src.main.graph import Graph
+from src.main.algorithms._csr import _snapshot
 
 
 def is_connected(graph: Graph) -> bool:
-    """Check if the graph is connected using BFS."""
-    if len(graph) <= 1:
-        return True
-
-    vertices = graph.get_vertices()
-    start = next(iter(vertices))
-    visited = _bfs_visit(graph, start)
-
-    return len(visited) == len(graph)
+    """Check if the graph is connected using the graph's union-find."""
+    return graph.num_components() <= 1
 
 
 def find_path(graph: Graph, start: Any, end: Any) -> Optional[List[Any]]:
     """Find a path between start and end vertices using BFS."""
-    if start not in graph.get_vertices():
+    return _shortest_path_bfs(graph, start, end)
+
+
+def _shortest_path_bfs(graph: Graph, start: Any, end: Any) -> Optional[List[Any]]:
+    """
+    Helper function to find a shortest path with a bidirectional BFS.
+
+    Stops as soon as the searches from both endpoints meet. Raises KeyError
+    if start is missing; returns None if end is missing or unreachable.
+    """
+    vertices, vid, indptr, indices = _snapshot(graph)
+    if start not in vid:
         raise KeyError(f"Start vertex {start} not in graph")
 
     # Return None if end vertex doesn't exist
-    if end not in graph.get_vertices():
+    if end not in vid:
         return None
 
     if start == end:
         return [start]
 
-    visited = {start}
-    predecessors: Dict[Any, Any] = {}
-    queue = deque([start])
-
-    while queue:
-        current = queue.popleft()
-        for neighbor in graph.get_neighbors(current):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                predecessors[neighbor] = current
-                queue.append(neighbor)
-
-                if neighbor == end:
-                    return _reconstruct_path(predecessors, start, end)
+    path = _bidirectional_bfs(indptr, indices, vid[start], vid[end])
+    if path is None:
+        return None
 
-    return None
+    return [vertices[i] for i in path]
 
 
 def get_connected_components(graph: Graph) -> List[Set[Any]]:
-    """Find all connected components in the graph."""
-    components = []
-    unvisited = graph.get_vertices()
-
-    while unvisited:
-        start = next(iter(unvisited))
-        component = _bfs_visit(graph, start)
-        components.append(component)
-        unvisited -= component
-
-    return components
-
-
-def _bfs_visit(graph: Graph, start: Any) -> Set[Any]:
-    """Helper function to perform BFS from a starting vertex."""
-    visited = {start}
-    queue = deque([start])
-
-    while queue:
-        current = queue.popleft()
-        for neighbor in graph.get_neighbors(current):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append(neighbor)
-
-    return visited
-
+    """Find all connected components in the graph using the graph's union-find."""
+    return graph.components()
+
+
+def _bidirectional_bfs(indptr: array, indices: array,
+                       start: int, end: int) -> Optional[List[int]]:
+    """
+    Helper function to find a shortest path of vertex ids from start to end.
+
+    Grows BFS layers from both endpoints, always expanding the smaller
+    frontier, and stops as soon as the two searches meet.
+    """
+    n = len(indptr) - 1
+    visited_f = bytearray(n)
+    visited_b = bytearray(n)
+    visited_f[start] = 1
+    visited_b[end] = 1
+    pred_f = array('i', [-1]) * n
+    pred_b = array('i', [-1]) * n
+
+    # Each vertex is enqueued at most once, so the queues never wrap
+    queue_f = array('i', [0]) * n
+    queue_b = array('i', [0]) * n
+    queue_f[0] = start
+    queue_b[0] = end
+    head_f, tail_f = 0, 1
+    head_b, tail_b = 0, 1
+    meet = -1
+
+    while meet < 0 and head_f < tail_f and head_b < tail_b:
+        if tail_f - head_f <= tail_b - head_b:
+            meet, head_f, tail_f = _expand_layer(indptr, indices, queue_f, head_f, tail_f,
+                                                 visited_f, pred_f, visited_b)
+        else:
+            meet, head_b, tail_b = _expand_layer(indptr, indices, queue_b, head_b, tail_b,
+                                                 visited_b, pred_b, visited_f)
+
+    if meet < 0:
+        return None
 
-def _reconstruct_path(predecessors: Dict[Any, Any], start: Any, end: Any) -> List[Any]:
-    """Helper function to reconstruct path from predecessors dictionary."""
-    path = [end]
+    path = _reconstruct_path(pred_f, start, meet)
+    while meet != end:
+        meet = pred_b[meet]
+        path.append(meet)
+    return path
+
+
+def _expand_layer(indptr: array, indices: array, queue: array, head: int, tail: int,
+                  visited: bytearray, pred: array, other: bytearray):
+    """
+    Helper function to expand one BFS layer of a bidirectional search.
+
+    Returns (meet, head, tail) where meet is the first vertex also visited
+    by the other search, or -1. Any meeting point found while expanding a
+    whole layer lies on a shortest path.
+    """
+    layer_end = tail
+    while head < layer_end:
+        current = queue[head]
+        head += 1
+        for j in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[j]
+            if visited[neighbor]:
+                continue
+            visited[neighbor] = 1
+            pred[neighbor] = current
+
+            if other[neighbor]:
+                return neighbor, head, tail
+
+            queue[tail] = neighbor
+            tail += 1
+
+    return -1, head, tail
+
+
+def _reconstruct_path(predecessors: Union[Sequence[int], Mapping[Any, Any]],
+                      start: Any, end: Any) -> List[Any]:
+    """
+    Helper function to reconstruct the path from start to end.
+
+    predecessors maps each vertex to its parent, either as an array of
+    vertex ids or as a dictionary of vertices.
+    """
+    # Measure the chain first so the path can be filled back to front
+    length = 1
     current = end
-
     while current != start:
         current = predecessors[current]
-        path.append(current)
+        length += 1
+
+    path = [None] * length
+    current = end
+    for i in range(length - 1, -1, -1):
+        path[i] = current
+        current = predecessors[current]
 
-    return list(reversed(path))
+    return path
 
 
 def is_tree(graph: Graph) -> bool:
-    """Check if the graph is a tree."""
+    """Check if the graph is a tree using a single BFS."""
     if len(graph) == 0:
         return True
 
@@ -95,5 +149,25 @@ def is_tree(graph: Graph) -> bool:
     if graph.size() != len(graph) - 1:
         return False
 
-    # A tree must be connected
-    return is_connected(graph)
+    # A tree must be connected and acyclic; check both in one traversal
+    vertices, _, indptr, indices = _snapshot(graph)
+    visited = bytearray(len(vertices))
+    visited[0] = 1
+    parent = array('i', [-1]) * len(vertices)
+    queue = array('i', [0]) * len(vertices)
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        for j in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[j]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                queue[tail] = neighbor
+                tail += 1
+            elif neighbor != parent[current]:
+                return False
+
+    return tail == len(vertices)
@@ -1,29 +1,45 @@
-from typing import List, Set, Any, Optional
+from array import array
+from typing import List, Any, Optional
 from src.main.graph import Graph
+from src.main.algorithms._csr import _DONE, _snapshot
+from src.main.algorithms._johnson import johnson_all_cycles
+from src.main.algorithms._kernels import HAVE_NUMBA, as_numpy
+
+if HAVE_NUMBA:
+    from src.main.algorithms._kernels import has_cycle_csr
 
 
 def has_cycle(graph: Graph) -> bool:
     """Check if the graph contains any cycles using DFS."""
-    visited = set()
-    path_vertices = set()
-
-    def dfs_cycle_check(vertex: Any, parent: Any = None) -> bool:
-        visited.add(vertex)
-        path_vertices.add(vertex)
-
-        for neighbor in graph.get_neighbors(vertex):
-            if neighbor not in visited:
-                if dfs_cycle_check(neighbor, vertex):
-                    return True
-            elif neighbor in path_vertices and neighbor != parent:
-                return True
-
-        path_vertices.remove(vertex)
-        return False
-
-    for vertex in graph.get_vertices():
-        if vertex not in visited:
-            if dfs_cycle_check(vertex):
+    vertices, _, indptr, indices = _snapshot(graph)
+    if HAVE_NUMBA:
+        return bool(has_cycle_csr(*as_numpy(indptr, indices), len(vertices)))
+
+    visited = bytearray(len(vertices))
+    path_vertices = bytearray(len(vertices))
+
+    for root in range(len(vertices)):
+        if visited[root]:
+            continue
+
+        visited[root] = 1
+        path_vertices[root] = 1
+        stack = [(root, iter(indices[indptr[root]:indptr[root + 1]]), -1)]
+
+        while stack:
+            vertex, neighbors, parent = stack[-1]
+            neighbor = next(neighbors, _DONE)
+
+            if neighbor is _DONE:
+                stack.pop()
+                path_vertices[vertex] = 0
+            elif not visited[neighbor]:
+                visited[neighbor] = 1
+                path_vertices[neighbor] = 1
+                stack.append((neighbor,
+                              iter(indices[indptr[neighbor]:indptr[neighbor + 1]]),
+                              vertex))
+            elif path_vertices[neighbor] and neighbor != parent:
                 return True
 
     return False
@@ -31,104 +47,87 @@ def has_cycle(graph: Graph) -> bool:
 
 def find_cycle(graph: Graph) -> Optional[List[Any]]:
     """Find a cycle in the graph if one exists."""
-    visited = set()
+    vertices, _, indptr, indices = _snapshot(graph)
+    visited = bytearray(len(vertices))
     path_vertices = {}
     parent = {}
 
-    def dfs_find_cycle(vertex: Any, path_pos: int) -> Optional[List[Any]]:
-        visited.add(vertex)
-        path_vertices[vertex] = path_pos
+    for root in range(len(vertices)):
+        if visited[root]:
+            continue
 
-        for neighbor in graph.get_neighbors(vertex):
-            if neighbor not in visited:
+        visited[root] = 1
+        path_vertices[root] = 0
+        stack = [(root, iter(indices[indptr[root]:indptr[root + 1]]))]
+
+        while stack:
+            vertex, neighbors = stack[-1]
+            neighbor = next(neighbors, _DONE)
+
+            if neighbor is _DONE:
+                stack.pop()
+                path_vertices.pop(vertex)
+            elif not visited[neighbor]:
+                visited[neighbor] = 1
                 parent[neighbor] = vertex
-                cycle = dfs_find_cycle(neighbor, path_pos + 1)
-                if cycle is not None:
-                    return cycle
+                path_vertices[neighbor] = len(stack)
+                stack.append((neighbor,
+                              iter(indices[indptr[neighbor]:indptr[neighbor + 1]])))
             elif neighbor in path_vertices and neighbor != parent.get(vertex):
                 # Found a cycle - reconstruct it
                 cycle_start = path_vertices[neighbor]
                 current_pos = path_vertices[vertex]
-                cycle = [v for v, pos in path_vertices.items()
+                cycle = [vertices[v] for v, pos in path_vertices.items()
                         if cycle_start <= pos <= current_pos]
                 return cycle
 
-        path_vertices.pop(vertex)
-        return None
-
-    for vertex in graph.get_vertices():
-        if vertex not in visited:
-            cycle = dfs_find_cycle(vertex, 0)
-            if cycle is not None:
-                return cycle
-
     return None
 
 
 def find_all_cycles(graph: Graph) -> List[List[Any]]:
-    """Find all simple cycles in the graph."""
-    def normalize_cycle(cycle: List[Any]) -> tuple:
-        """Helper function to normalize cycle representation."""
-        min_vertex = min(cycle)
-        min_idx = cycle.index(min_vertex)
-        normalized = cycle[min_idx:] + cycle[:min_idx]
-        return tuple(normalized)
-
-    def find_cycles_from_start(start: Any, visited: Set[Any],
-                             path: List[Any]) -> List[List[Any]]:
-        cycles = []
-        visited.add(start)
-        path.append(start)
-
-        for neighbor in graph.get_neighbors(start):
-            if neighbor not in visited:
-                cycles.extend(find_cycles_from_start(neighbor, visited.copy(),
-                                                   path.copy()))
-            elif neighbor == path[0] and len(path) > 2:
-                cycles.append(path[:])
-
-        return cycles
-
-    all_cycles = []
-    seen_normalized_cycles = set()
-
-    for vertex in graph.get_vertices():
-        cycles = find_cycles_from_start(vertex, set(), [])
-        for cycle in cycles:
-            normalized = normalize_cycle(cycle)
-            if normalized not in seen_normalized_cycles:
-                all_cycles.append(cycle)
-                seen_normalized_cycles.add(normalized)
-
-    return all_cycles
+    """Find all simple cycles in the graph using Johnson's algorithm."""
+    vertices, _, indptr, indices = _snapshot(graph)
+    cycles = johnson_all_cycles(indptr, indices, len(vertices))
+    return [[vertices[v] for v in cycle] for cycle in cycles]
 
 
 def get_cycle_basis(graph: Graph) -> List[List[Any]]:
     """Find a cycle basis of the graph."""
+    vertices, _, indptr, indices = _snapshot(graph)
     cycle_basis = []
-    visited = set()
-    parent = {}
+    parent = array('i', [-1]) * len(vertices)
+    depth = array('i', [-1]) * len(vertices)
+    cursor = indptr[:-1]
+
+    for root in range(len(vertices)):
+        if depth[root] >= 0:
+            continue
+
+        depth[root] = 0
+        stack = [root]
 
-    def dfs_cycle_basis(vertex: Any, parent_vertex: Any = None) -> None:
-        visited.add(vertex)
-        parent[vertex] = parent_vertex
+        while stack:
+            vertex = stack[-1]
+            j = cursor[vertex]
 
-        for neighbor in graph.get_neighbors(vertex):
-            if neighbor not in visited:
-                dfs_cycle_basis(neighbor, vertex)
-            elif neighbor != parent_vertex and vertex == parent.get(neighbor, vertex):
-                # Found a fundamental cycle
+            if j == indptr[vertex + 1]:
+                stack.pop()
+                continue
+
+            cursor[vertex] = j + 1
+            neighbor = indices[j]
+            if depth[neighbor] < 0:
+                parent[neighbor] = vertex
+                depth[neighbor] = depth[vertex] + 1
+                stack.append(neighbor)
+            elif neighbor != parent[vertex] and depth[neighbor] < depth[vertex]:
+                # Back edge to an ancestor closes a fundamental cycle
                 cycle = []
                 current = vertex
                 while current != neighbor:
-                    cycle.append(current)
+                    cycle.append(vertices[current])
                     current = parent[current]
-                cycle.append(neighbor)
-                cycle.append(vertex)
+                cycle.append(vertices[neighbor])
                 cycle_basis.append(cycle)
 
-    for vertex in graph.get_vertices():
-        if vertex not in visited:
-            dfs_cycle_basis(vertex)
-
-    return cycle_basis
\ No newline at end of file
+    return cycle_basis
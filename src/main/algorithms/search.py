@@ -1,62 +1,126 @@
-from collections import deque
-from typing import List, Dict, Any, Optional
+from array import array
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 from src.main.graph import Graph
+from src.main.algorithms._csr import _DONE, _snapshot, _bfs, _dfs
+from src.main.algorithms._kernels import HAVE_NUMBA, as_numpy
+from src.main.algorithms.connectivity import _reconstruct_path, _shortest_path_bfs
+
+if HAVE_NUMBA:
+    import numpy as np
+    from src.main.algorithms._kernels import bfs_csr, bfs_multi_source, dfs_csr
 
 
 def breadth_first_search(graph: Graph, start: Any) -> Dict[str, Any]:
     """Perform breadth-first search starting from a given vertex."""
-    if start not in graph.get_vertices():
+    vertices, vid, indptr, indices = _snapshot(graph)
+    if start not in vid:
         raise KeyError(f"Start vertex {start} not found in graph")
 
-    visited_order = []
-    distances = {start: 0}
-    predecessors = {start: None}
-    queue = deque([start])
-
-    while queue:
-        current = queue.popleft()
-        visited_order.append(current)
+    if HAVE_NUMBA:
+        order, distances, predecessors = (
+            a.tolist() for a in bfs_csr(*as_numpy(indptr, indices), vid[start], len(vertices))
+        )
+    else:
+        visited = bytearray(len(vertices))
+        predecessors = array('i', [-1]) * len(vertices)
+        order = _bfs(indptr, indices, vid[start], visited, predecessors)
 
-        for neighbor in graph.get_neighbors(current):
-            if neighbor not in distances:
-                distances[neighbor] = distances[current] + 1
-                predecessors[neighbor] = current
-                queue.append(neighbor)
+        # Predecessors are visited before their successors
+        distances = array('i', [0]) * len(vertices)
+        for i in order[1:]:
+            distances[i] = distances[predecessors[i]] + 1
 
     return {
-        'visited_order': visited_order,
-        'distances': distances,
-        'predecessors': predecessors
+        'visited_order': [vertices[i] for i in order],
+        'distances': {vertices[i]: distances[i] for i in order},
+        'predecessors': {vertices[i]: _vertex_or_none(vertices, predecessors[i])
+                         for i in order}
     }
 
 
-def depth_first_search(graph: Graph, start: Any) -> Dict[str, Any]:
-    """Perform depth-first search starting from a given vertex."""
-    if start not in graph.get_vertices():
-        raise KeyError(f"Start vertex {start} not found in graph")
+def bfs_cached(graph: Graph, start: Any, cache_size: int = 1000) -> Dict[str, Any]:
+    """
+    Perform breadth-first search, reusing earlier results from the same start.
 
-    visited_order = []
-    discovery_times = {}
-    finish_times = {}
-    predecessors = {start: None}
-    time = 0
+    Up to cache_size results are kept per graph, evicting the least recently
+    used, and all of them are dropped once the graph is modified. Intended
+    for algorithms that repeatedly need distances from a set of sources.
 
-    def dfs_visit(vertex: Any) -> None:
-        nonlocal time
-        time += 1
-        discovery_times[vertex] = time
-        visited_order.append(vertex)
+    Returns:
+        The breadth_first_search result, shared with later calls and so not
+        to be modified.
+    """
+    if graph._bfs_cache is None or graph._bfs_cache[0] != graph._version:
+        graph._bfs_cache = (graph._version, OrderedDict())
+    cache = graph._bfs_cache[1]
 
-        for neighbor in graph.get_neighbors(vertex):
-            if neighbor not in discovery_times:
-                predecessors[neighbor] = vertex
-                dfs_visit(neighbor)
+    if start in cache:
+        cache.move_to_end(start)
+        return cache[start]
 
-        time += 1
-        finish_times[vertex] = time
+    result = breadth_first_search(graph, start)
+    cache[start] = result
+    while len(cache) > cache_size:
+        cache.popitem(last=False)
+    return result
+
+
+def multi_source_distances(graph: Graph, sources: Iterable[Any]) -> Dict[Any, Dict[Any, int]]:
+    """
+    Compute BFS distances from several source vertices at once.
+
+    With Numba installed the searches run in parallel across cores.
+
+    Returns:
+        A dictionary mapping each source to its distances dictionary, as in
+        breadth_first_search, covering the vertices reachable from it.
+    """
+    vertices, vid, indptr, indices = _snapshot(graph)
+    sources = list(sources)
+    for source in sources:
+        if source not in vid:
+            raise KeyError(f"Start vertex {source} not found in graph")
+
+    source_ids = [vid[source] for source in sources]
+    if HAVE_NUMBA:
+        matrix = bfs_multi_source(*as_numpy(indptr, indices),
+                                  np.array(source_ids, dtype=np.int32), len(vertices))
+        rows = matrix.tolist()
+    else:
+        rows = []
+        for source_id in source_ids:
+            predecessors = array('i', [-1]) * len(vertices)
+            order = _bfs(indptr, indices, source_id, bytearray(len(vertices)), predecessors)
+            row = [-1] * len(vertices)
+            row[source_id] = 0
+            for i in order[1:]:
+                row[i] = row[predecessors[i]] + 1
+            rows.append(row)
+
+    return {source: {vertices[i]: d for i, d in enumerate(row) if d >= 0}
+            for source, row in zip(sources, rows)}
 
-    dfs_visit(start)
+
+def depth_first_search(graph: Graph, start: Any) -> Dict[str, Any]:
+    """Perform depth-first search starting from a given vertex."""
+    vertices, vid, indptr, indices = _snapshot(graph)
+    if start not in vid:
+        raise KeyError(f"Start vertex {start} not found in graph")
+
+    if HAVE_NUMBA:
+        order, discovery, finished, finish, predecessors = (
+            a.tolist() for a in dfs_csr(*as_numpy(indptr, indices), vid[start], len(vertices))
+        )
+    else:
+        order, discovery, finished, finish, predecessors = _dfs(indptr, indices, vid[start])
+
+    visited_order = [vertices[i] for i in order]
+    discovery_times = {vertices[i]: discovery[i] for i in order}
+    finish_times = {vertices[i]: finish[i] for i in finished}
+    predecessors = {vertices[i]: _vertex_or_none(vertices, predecessors[i])
+                    for i in order}
 
     return {
         'visited_order': visited_order,
@@ -68,48 +132,90 @@ def depth_first_search(graph: Graph, start: Any) -> Dict[str, Any]:
 
 def find_path_bfs(graph: Graph, start: Any, end: Any) -> Optional[List[Any]]:
     """Find shortest path between start and end vertices using BFS."""
-    if start not in graph.get_vertices():
-        raise KeyError(f"Start vertex {start} not found in graph")
-
-    # Return None if end vertex doesn't exist
-    if end not in graph.get_vertices():
-        return None
-
-    result = breadth_first_search(graph, start)
-    predecessors = result['predecessors']
+    cached = graph._bfs_cache
+    if cached is None or cached[0] != graph._version or start not in cached[1]:
+        # Bidirectional search, stopping as soon as the two sides meet
+        return _shortest_path_bfs(graph, start, end)
 
+    # Reuse a full search from start left by bfs_cached
+    predecessors = cached[1][start]['predecessors']
     if end not in predecessors:
         return None
 
-    # Reconstruct path
-    path = []
-    current = end
-    while current is not None:
-        path.append(current)
-        current = predecessors[current]
+    return _reconstruct_path(predecessors, start, end)
 
-    return list(reversed(path))
 
+def find_all_paths_dfs(graph: Graph, start: Any, end: Any, *,
+                       max_paths: Optional[int] = None,
+                       max_depth: Optional[int] = None) -> Iterator[List[Any]]:
+    """
+    Find all simple paths between start and end vertices using DFS.
 
-def find_all_paths_dfs(graph: Graph, start: Any, end: Any) -> List[List[Any]]:
-    """Find all possible paths between start and end vertices using DFS."""
-    if start not in graph.get_vertices() or end not in graph.get_vertices():
+    Paths are yielded one at a time, so callers needing a list should wrap
+    the call in list(). The number of paths can grow exponentially with
+    the graph; max_paths stops after that many paths and max_depth skips
+    paths with more than that many edges.
+    """
+    vertices, vid, indptr, indices = _snapshot(graph)
+    if start not in vid or end not in vid:
         raise KeyError("Start or end vertex not found in graph")
 
-    def dfs_paths(current: Any, path: List[Any], paths: List[List[Any]]) -> None:
-        if current == end:
-            paths.append(path[:])
-            return
+    return _iter_paths(vertices, indptr, indices, vid[start], vid[end],
+                       max_paths, max_depth)
+
+
+def _iter_paths(vertices: List[Any], indptr: array, indices: array,
+                start: int, end: int, max_paths: Optional[int],
+                max_depth: Optional[int]) -> Iterator[List[Any]]:
+    """Helper function to generate the simple paths of vertex ids from start to end."""
+    if max_paths is not None and max_paths <= 0:
+        return
+    if start == end:
+        yield [vertices[start]]
+        return
+    if max_depth is None:
+        max_depth = len(vertices)
+
+    # The current path is a linked list of (vertex, rest) cells, so paths
+    # share their prefixes and are only copied out when end is reached
+    on_path = bytearray(len(vertices))
+    on_path[start] = 1
+    found = 0
+    stack = [(iter(indices[indptr[start]:indptr[start + 1]]), (start, None), 0)]
+
+    while stack:
+        neighbors, tail, depth = stack[-1]
+        neighbor = next(neighbors, _DONE)
+
+        if neighbor is _DONE:
+            stack.pop()
+            on_path[tail[0]] = 0
+        elif on_path[neighbor] or depth >= max_depth:
+            continue
+        elif neighbor == end:
+            yield _materialize(vertices, (neighbor, tail))
+            found += 1
+            if found == max_paths:
+                return
+        elif depth + 1 < max_depth:
+            on_path[neighbor] = 1
+            stack.append((iter(indices[indptr[neighbor]:indptr[neighbor + 1]]),
+                          (neighbor, tail), depth + 1))
+
+
+def _materialize(vertices: List[Any], tail: Optional[tuple]) -> List[Any]:
+    """Helper function to turn a linked (vertex id, rest) path into a vertex list."""
+    path = []
+    while tail is not None:
+        vertex, tail = tail
+        path.append(vertices[vertex])
+    path.reverse()
+    return path
 
-        for neighbor in graph.get_neighbors(current):
-            if neighbor not in path:
-                path.append(neighbor)
-                dfs_paths(neighbor, path, paths)
-                path.pop()
 
-    all_paths = []
-    dfs_paths(start, [start], all_paths)
-    return all_paths
+def _vertex_or_none(vertices: List[Any], vertex_id: int) -> Any:
+    """Helper function to map a vertex id back to its vertex, with -1 as None."""
+    return None if vertex_id < 0 else vertices[vertex_id]
 
 
 def get_search_tree(predecessors: Dict[Any, Any]) -> Dict[Any, List[Any]]:
@@ -1,23 +1,89 @@
+from array import array
 from collections import defaultdict
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Tuple, Any, Optional
+
+
+class DisjointSet:
+    """
+    Union-find over the integers 0..n-1 using union by rank and path halving.
+    """
+
+    def __init__(self, n: int):
+        """Initialize n singleton sets."""
+        self.parent: List[int] = list(range(n))
+        self.rank: List[int] = [0] * n
+        self.count: int = n
+
+    def add(self) -> int:
+        """Add a new singleton set and return its element."""
+        self.parent.append(len(self.parent))
+        self.rank.append(0)
+        self.count += 1
+        return len(self.parent) - 1
+
+    def find(self, x: int) -> int:
+        """Return the root of the set containing x."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets containing a and b. Return False if already merged."""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+
+        # Link the shallower tree under the deeper one
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self.count -= 1
+        return True
 
 
 class Graph:
     """
     A class representing an undirected graph using an adjacency list representation.
+
+    Each vertex's neighbors are kept in a dict used as an insertion-ordered
+    set, so edge lookups and removals are O(1) and iteration is deterministic.
     """
 
     def __init__(self):
         """Initialize an empty graph."""
-        self._graph: Dict[Any, List[Any]] = defaultdict(list)
+        self._graph: Dict[Any, Dict[Any, None]] = defaultdict(dict)
         self._vertex_count: int = 0
         self._edge_count: int = 0
+        # Each edge once, as (smaller, larger) where comparable, in insertion order
+        self._edges: Dict[tuple, None] = {}
+        # Vertices are also numbered 0..V-1 for array-based algorithms
+        self._id: Dict[Any, int] = {}
+        self._obj: List[Any] = []
+        # Incremented on every mutation so algorithms can cache derived data
+        self._version: int = 0
+        # Connected components over vertex ids, kept up to date while only
+        # adding; None after a removal until the next connectivity query
+        self._components: Optional[DisjointSet] = DisjointSet(0)
+        self._csr_cache: Optional[tuple] = None
+        self._bfs_cache: Optional[tuple] = None
+        self._nx_cache: Optional[tuple] = None
 
     def add_vertex(self, vertex: Any) -> bool:
         """Add a vertex to the graph if it doesn't already exist."""
         if vertex not in self._graph:
-            self._graph[vertex] = []
+            self._graph[vertex] = {}
+            self._id[vertex] = len(self._obj)
+            self._obj.append(vertex)
+            if self._components is not None:
+                self._components.add()
             self._vertex_count += 1
+            self._version += 1
             return True
         return False
 
@@ -35,9 +101,13 @@ class Graph:
             return False
 
         # Add edge in both directions (undirected graph)
-        self._graph[v1].append(v2)
-        self._graph[v2].append(v1)
+        self._graph[v1][v2] = None
+        self._graph[v2][v1] = None
+        self._edges[_edge_key(v1, v2)] = None
+        if self._components is not None:
+            self._components.union(self._id[v1], self._id[v2])
         self._edge_count += 1
+        self._version += 1
         return True
 
     def remove_vertex(self, vertex: Any) -> bool:
@@ -45,14 +115,23 @@ class Graph:
         if vertex not in self._graph:
             return False
 
-        # Remove all edges containing this vertex
-        for neighbor in self._graph[vertex]:
-            self._graph[neighbor].remove(vertex)
-            self._edge_count -= 1
+        # Remove all edges containing this vertex; each is an O(1) dict delete
+        neighbors = self._graph[vertex]
+        for neighbor in neighbors:
+            del self._graph[neighbor][vertex]
+            self._discard_edge(vertex, neighbor)
+        self._edge_count -= len(neighbors)
 
-        # Remove the vertex
+        # Remove the vertex, moving the last vertex into its id
         del self._graph[vertex]
+        vertex_id = self._id.pop(vertex)
+        last = self._obj.pop()
+        if vertex_id < len(self._obj):
+            self._obj[vertex_id] = last
+            self._id[last] = vertex_id
         self._vertex_count -= 1
+        self._components = None
+        self._version += 1
         return True
 
     def remove_edge(self, v1: Any, v2: Any) -> bool:
@@ -63,16 +142,104 @@ class Graph:
         if v2 not in self._graph[v1]:
             return False
 
-        self._graph[v1].remove(v2)
-        self._graph[v2].remove(v1)
+        del self._graph[v1][v2]
+        del self._graph[v2][v1]
+        self._discard_edge(v1, v2)
         self._edge_count -= 1
+        self._components = None
+        self._version += 1
         return True
 
-    def get_neighbors(self, vertex: Any) -> List[Any]:
+    def _discard_edge(self, v1: Any, v2: Any) -> None:
+        """Remove the edge between v1 and v2 from the edge index."""
+        key = (v1, v2)
+        if key not in self._edges:
+            key = (v2, v1)
+        del self._edges[key]
+
+    def get_neighbors(self, vertex: Any) -> Tuple[Any, ...]:
         """Get all vertices that share an edge with the given vertex."""
         if vertex not in self._graph:
             raise KeyError(f"Vertex {vertex} not found in graph")
-        return self._graph[vertex].copy()
+        return tuple(self._graph[vertex])
+
+    def get_neighbors_ids(self, vertex_id: int) -> array:
+        """Get the ids of all vertices that share an edge with the vertex with the given id."""
+        ids = self._id
+        return array('i', [ids[neighbor] for neighbor in self._graph[self._obj[vertex_id]]])
+
+    def vertex_ids(self) -> range:
+        """Get the ids of all vertices, which are always 0..len(graph)-1."""
+        return range(len(self._obj))
+
+    def get_vertex(self, vertex_id: int) -> Any:
+        """Get the vertex with the given id."""
+        return self._obj[vertex_id]
+
+    def get_vertex_id(self, vertex: Any) -> int:
+        """Get the id of the given vertex."""
+        if vertex not in self._id:
+            raise KeyError(f"Vertex {vertex} not found in graph")
+        return self._id[vertex]
+
+    def freeze(self) -> Tuple[array, array, Dict[Any, int], List[Any]]:
+        """
+        Get a Compressed Sparse Row (CSR) view of the graph.
+
+        The neighbors of the vertex with id u are
+        indices[indptr[u]:indptr[u + 1]], in the order get_neighbors returns
+        them. The view is cached and rebuilt only after the graph changes;
+        it is not updated by later modifications.
+
+        Returns:
+            A tuple (indptr, indices, vertex_to_id, id_to_vertex) where
+            indptr and indices are int arrays of lengths V + 1 and 2|E|.
+            All four are shared with later calls and with the graph
+            algorithms, and so are not to be modified.
+        """
+        if self._csr_cache is not None and self._csr_cache[0] == self._version:
+            return self._csr_cache[1]
+
+        indptr = array('i', [0]) * (len(self._obj) + 1)
+        indices = array('i')
+        for i in self.vertex_ids():
+            indices.extend(self.get_neighbors_ids(i))
+            indptr[i + 1] = len(indices)
+
+        # Copy the id maps so the view stays consistent if the graph changes
+        frozen = (indptr, indices, dict(self._id), list(self._obj))
+        self._csr_cache = (self._version, frozen)
+        return frozen
+
+    def same_component(self, u: Any, v: Any) -> bool:
+        """Check whether there is a path between vertices u and v."""
+        for vertex in (u, v):
+            if vertex not in self._id:
+                raise KeyError(f"Vertex {vertex} not found in graph")
+        components = self._union_find()
+        return components.find(self._id[u]) == components.find(self._id[v])
+
+    def num_components(self) -> int:
+        """Return the number of connected components in the graph."""
+        return self._union_find().count
+
+    def components(self) -> List[Set[Any]]:
+        """Get the vertex sets of the connected components of the graph."""
+        union_find = self._union_find()
+        components: Dict[int, Set[Any]] = defaultdict(set)
+        for vertex_id, vertex in enumerate(self._obj):
+            components[union_find.find(vertex_id)].add(vertex)
+        return list(components.values())
+
+    def _union_find(self) -> DisjointSet:
+        """Get the component union-find, rebuilding it from the edges after removals."""
+        if self._components is None:
+            ids = self._id
+            components = DisjointSet(len(self._obj))
+            for v1, v2 in self._edges:
+                components.union(ids[v1], ids[v2])
+            self._components = components
+        return self._components
 
     def get_vertices(self) -> Set[Any]:
         """Get all vertices in the graph."""
@@ -80,16 +247,7 @@ class Graph:
 
     def get_edges(self) -> List[tuple]:
         """Get all edges in the graph."""
-        edges = []
-        seen = set()
-
-        for v1 in self._graph:
-            for v2 in self._graph[v1]:
-                edge = tuple(sorted([v1, v2]))
-                if edge not in seen:
-                    edges.append(edge)
-                    seen.add(edge)
-        return edges
+        return list(self._edges)
 
     def __len__(self) -> int:
         """Return the number of vertices in the graph."""
@@ -105,4 +263,12 @@ class Graph:
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the graph."""
-        return f"Graph(vertices={list(self._graph.keys())}, edges={self.get_edges()})"
\ No newline at end of file
+        return f"Graph(vertices={list(self._graph.keys())}, edges={self.get_edges()})"
+
+
+def _edge_key(v1: Any, v2: Any) -> tuple:
+    """Orient an edge as (smaller, larger), or as given if the vertices don't compare."""
+    try:
+        return (v2, v1) if v2 < v1 else (v1, v2)
+    except TypeError:
+        return (v1, v2)
@@ -1,8 +1,23 @@
+import os
 import networkx as nx
+import matplotlib
+
+# Render without a display, e.g. in tests or batch jobs
+if os.environ.get("TOPO_HEADLESS"):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
-from typing import List, Set, Dict, Any, Optional, Union
+from typing import List, Set, Dict, Tuple, Any, Optional, Union
 from src.main.graph import Graph
 
+try:
+    import pygraphviz
+except ImportError:
+    pygraphviz = None
+
+# Above this many vertices Graphviz's sfdp, when installed, lays out the graph
+_SFDP_THRESHOLD = 200
+
 
 def visualize_graph(graph: Graph,
                     title: str = "Graph Visualization",
@@ -16,7 +31,10 @@ def visualize_graph(graph: Graph,
                     edge_color_highlight: str = 'red',
                     edge_width_default: float = 1.0,
                     edge_width_highlight: float = 2.0,
-                    figsize: tuple = (10, 8)) -> None:
+                    figsize: tuple = (10, 8),
+                    ax: Optional[plt.Axes] = None,
+                    savefig: Optional[str] = None,
+                    layout: Optional[Dict[Any, Any]] = None) -> None:
     """
     Visualize a graph with optional highlighting of specific nodes and edges.
 
@@ -34,70 +52,116 @@ def visualize_graph(graph: Graph,
         edge_width_default: Width for regular edges
         edge_width_highlight: Width for highlighted edges
         figsize: Figure size as (width, height)
+        ax: Axes to draw into instead of a new figure, which is then not shown
+        savefig: Path to save the figure to instead of showing it
+        layout: Precomputed node positions to use instead of the default layout
     """
-    # Convert to networkx format
-    G = nx.Graph()
-    G.add_edges_from(graph.get_edges())
-
-    # Add any isolated vertices
-    for vertex in graph.get_vertices():
-        if vertex not in G:
-            G.add_node(vertex)
+    G, pos = _get_nx_and_pos(graph, with_pos=layout is None)
+    if layout is not None:
+        pos = layout
 
     # Set up the plot
-    plt.figure(figsize=figsize)
-    pos = nx.spring_layout(G, k=1, iterations=50)  # k=1 for more spread out layout
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig = ax.figure
 
     # Draw regular edges
     if highlight_edges:
-        regular_edges = [e for e in G.edges if e not in highlight_edges
-                         and tuple(reversed(e)) not in highlight_edges]
-        nx.draw_networkx_edges(G, pos,
+        # Unordered endpoint pairs, so either edge direction matches
+        hl = frozenset(frozenset(e) for e in highlight_edges)
+        regular_edges = [e for e in G.edges if frozenset(e) not in hl]
+        nx.draw_networkx_edges(G, pos, ax=ax,
                                edgelist=regular_edges,
                                edge_color=edge_color_default,
                                width=edge_width_default)
         # Draw highlighted edges
-        nx.draw_networkx_edges(G, pos,
+        nx.draw_networkx_edges(G, pos, ax=ax,
                                edgelist=highlight_edges,
                                edge_color=edge_color_highlight,
                                width=edge_width_highlight)
     else:
-        nx.draw_networkx_edges(G, pos,
+        nx.draw_networkx_edges(G, pos, ax=ax,
                                edge_color=edge_color_default,
                                width=edge_width_default)
 
     # Draw regular nodes
     if highlight_nodes:
-        regular_nodes = [n for n in G.nodes if n not in highlight_nodes]
-        nx.draw_networkx_nodes(G, pos,
+        hn = frozenset(highlight_nodes)
+        regular_nodes = [n for n in G.nodes if n not in hn]
+        nx.draw_networkx_nodes(G, pos, ax=ax,
                                nodelist=regular_nodes,
                                node_color=node_color,
                                node_size=node_size)
         # Draw highlighted nodes
-        nx.draw_networkx_nodes(G, pos,
+        nx.draw_networkx_nodes(G, pos, ax=ax,
                                nodelist=highlight_nodes,
                                node_color=highlight_color,
                                node_size=node_size)
     else:
-        nx.draw_networkx_nodes(G, pos,
+        nx.draw_networkx_nodes(G, pos, ax=ax,
                                node_color=node_color,
                                node_size=node_size)
 
     # Add labels if requested
     if with_labels:
-        nx.draw_networkx_labels(G, pos,
+        nx.draw_networkx_labels(G, pos, ax=ax,
                                 font_size=12,
                                 font_weight='bold')
 
-    plt.title(title, pad=20)
-    plt.axis('off')  # Hide axes
-    plt.tight_layout()
-    plt.show()
+    ax.set_title(title, pad=20)
+    ax.axis('off')  # Hide axes
+    if own_figure:
+        fig.tight_layout()
+
+    if savefig:
+        fig.savefig(savefig, dpi=100)
+        if own_figure:
+            plt.close(fig)
+    elif own_figure:
+        plt.show()
+
+
+def _get_nx_and_pos(graph: Graph,
+                    with_pos: bool = True) -> Tuple[nx.Graph, Optional[Dict[Any, Any]]]:
+    """
+    Helper function to convert a graph to networkx format and lay it out.
+
+    Both are cached on the graph until it is next modified, so repeated
+    visualizations skip the layout computation. With with_pos=False the
+    layout is not computed and may be returned as None.
+    """
+    if graph._nx_cache is not None and graph._nx_cache[0] == graph._version:
+        G, pos = graph._nx_cache[1], graph._nx_cache[2]
+    else:
+        # Convert to networkx format
+        G = nx.Graph()
+        G.add_edges_from(graph.get_edges())
+
+        # Add any isolated vertices
+        for vertex in graph.get_vertices():
+            if vertex not in G:
+                G.add_node(vertex)
+        pos = None
+
+    if pos is None and with_pos:
+        if len(G) > _SFDP_THRESHOLD and pygraphviz is not None:
+            # Multilevel force-directed layout in C, far faster than spring_layout
+            pos = nx.nx_agraph.graphviz_layout(G, prog="sfdp")
+        else:
+            # k=1 for more spread out layout, fixed seed for a stable picture
+            pos = nx.spring_layout(G, k=1, iterations=50, seed=0)
+
+    graph._nx_cache = (graph._version, G, pos)
+    return G, pos
 
 
 def visualize_path(graph: Graph,
                    path: List[Any],
-                   title: str = "Path Visualization") -> None:
+                   title: str = "Path Visualization",
+                   ax: Optional[plt.Axes] = None,
+                   savefig: Optional[str] = None) -> None:
     """
     Visualize a path in the graph by highlighting the path edges.
 
@@ -105,6 +169,8 @@ def visualize_path(graph: Graph,
         graph: The graph to visualize
         path: List of vertices forming the path
         title: Title of the plot
+        ax: Axes to draw into instead of a new figure
+        savefig: Path to save the figure to instead of showing it
     """
     if len(path) < 2:
         raise ValueError("Path must contain at least 2 vertices")
@@ -115,6 +181,8 @@ def visualize_path(graph: Graph,
     # Use the general visualization function with highlighting
     visualize_graph(graph,
                     title=title,
+                    ax=ax,
+                    savefig=savefig,
                     highlight_nodes=path,
                     highlight_edges=path_edges,
                     node_color='lightblue',
@@ -125,7 +193,9 @@ def visualize_path(graph: Graph,
 
 def visualize_components(graph: Graph,
                          components: List[Set[Any]],
-                         title: str = "Connected Components") -> None:
+                         title: str = "Connected Components",
+                         ax: Optional[plt.Axes] = None,
+                         savefig: Optional[str] = None) -> None:
     """
     Visualize connected components using different colors.
 
@@ -133,28 +203,30 @@ def visualize_components(graph: Graph,
         graph: The graph to visualize
         components: List of sets, where each set contains vertices in a component
         title: Title of the plot
+        ax: Axes to draw into instead of a new figure
+        savefig: Path to save the figure to instead of showing it
     """
     # Create color map for nodes
     colors = ['lightblue', 'lightgreen', 'salmon', 'yellow', 'lightgray',
               'lightpink', 'lightyellow', 'lightcyan']
-    color_map = []
-    vertices = list(graph.get_vertices())
+    comp_of = {v: i for i, component in enumerate(components) for v in component}
 
-    # Assign colors to vertices based on their component
-    for vertex in vertices:
-        for i, component in enumerate(components):
-            if vertex in component:
-                color_map.append(colors[i % len(colors)])
-                break
+    # Assign colors in the order networkx will draw the nodes
+    G, _ = _get_nx_and_pos(graph, with_pos=False)
+    color_map = [colors[comp_of[v] % len(colors)] for v in G.nodes()]
 
     visualize_graph(graph,
                     title=title,
+                    ax=ax,
+                    savefig=savefig,
                     node_color=color_map)
 
 
 def visualize_cycle(graph: Graph,
                     cycle: List[Any],
-                    title: str = "Cycle Visualization") -> None:
+                    title: str = "Cycle Visualization",
+                    ax: Optional[plt.Axes] = None,
+                    savefig: Optional[str] = None) -> None:
     """
     Visualize a cycle in the graph by highlighting cycle edges.
 
@@ -162,6 +234,8 @@ def visualize_cycle(graph: Graph,
         graph: The graph to visualize
         cycle: List of vertices forming the cycle
         title: Title of the plot
+        ax: Axes to draw into instead of a new figure
+        savefig: Path to save the figure to instead of showing it
     """
     if len(cycle) < 3:
         raise ValueError("Cycle must contain at least 3 vertices")
@@ -172,6 +246,8 @@ def visualize_cycle(graph: Graph,
     # Use the general visualization function with highlighting
     visualize_graph(graph,
                     title=title,
+                    ax=ax,
+                    savefig=savefig,
                     highlight_nodes=cycle,
                     highlight_edges=cycle_edges,
                     node_color='lightblue',
@@ -183,7 +259,9 @@ def visualize_cycle(graph: Graph,
 def visualize_search_tree(graph: Graph,
                           tree: Dict[Any, List[Any]],
                           root: Any,
-                          title: str = "Search Tree Visualization") -> None:
+                          title: str = "Search Tree Visualization",
+                          ax: Optional[plt.Axes] = None,
+                          savefig: Optional[str] = None) -> None:
     """
     Visualize a search tree (BFS or DFS) within the graph.
 
@@ -192,6 +270,8 @@ def visualize_search_tree(graph: Graph,
         tree: Dictionary representing the tree (output of get_search_tree)
         root: Root vertex of the tree
         title: Title of the plot
+        ax: Axes to draw into instead of a new figure
+        savefig: Path to save the figure to instead of showing it
     """
     # Create tree edges
     tree_edges = []
@@ -201,6 +281,8 @@ def visualize_search_tree(graph: Graph,
     # Use the general visualization function with highlighting
     visualize_graph(graph,
                     title=title,
+                    ax=ax,
+                    savefig=savefig,
                     highlight_nodes=[root],  # Highlight root node
                     highlight_edges=tree_edges,
                     node_color='lightblue',
@@ -49,4 +49,21 @@ def test_is_tree():
     g.add_edge(2, 3)
     assert is_tree(g)  # Simple path is a tree
     g.add_edge(1, 3)  # Creates cycle
-    assert not is_tree(g)
\ No newline at end of file
+    assert not is_tree(g)
+
+
+def test_components_after_modification():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    assert len(get_connected_components(g)) == 1
+    assert is_connected(g)
+
+    # Cached union-find must not survive a mutation
+    g.remove_edge(2, 3)
+    g.add_edge(3, 4)
+    components = get_connected_components(g)
+    assert len(components) == 2
+    assert {1, 2} in components
+    assert {3, 4} in components
+    assert not is_connected(g)
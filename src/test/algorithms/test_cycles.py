@@ -0,0 +1,62 @@
+import pytest
+from src.main.graph import Graph
+from src.main.algorithms import cycles
+from src.main.algorithms.cycles import has_cycle, find_cycle, find_all_cycles, get_cycle_basis
+from src.main.algorithms._kernels import HAVE_NUMBA
+
+
+@pytest.mark.parametrize('use_numba', [False, True], ids=['python', 'numba'])
+def test_has_cycle(monkeypatch, use_numba):
+    if use_numba and not HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(cycles, 'HAVE_NUMBA', use_numba)
+
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    assert not has_cycle(g)  # Simple path
+    g.add_edge(3, 1)
+    assert has_cycle(g)  # Triangle
+
+
+def test_find_cycle():
+    g = Graph()
+    g.add_edge(1, 2)
+    assert find_cycle(g) is None
+    g.add_edge(2, 3)
+    g.add_edge(3, 1)
+    assert sorted(find_cycle(g)) == [1, 2, 3]
+
+
+def test_find_all_cycles():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.add_edge(3, 1)
+    g.add_edge(3, 4)
+    g.add_edge(4, 1)
+
+    # Each cycle is reported once, regardless of rotation or direction
+    cycles = find_all_cycles(g)
+    assert len(cycles) == 3
+    assert {frozenset(c) for c in cycles} == {
+        frozenset({1, 2, 3}), frozenset({1, 3, 4}), frozenset({1, 2, 3, 4})
+    }
+
+
+def test_get_cycle_basis():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.add_edge(3, 1)
+    g.add_edge(3, 4)
+    g.add_edge(4, 1)
+    g.add_edge(5, 6)
+
+    # A basis has |E| - |V| + (number of components) cycles
+    basis = get_cycle_basis(g)
+    assert len(basis) == 6 - 6 + 2
+    for cycle in basis:
+        assert len(cycle) == len(set(cycle)) >= 3
+        for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+            assert v in g.get_neighbors(u)
@@ -0,0 +1,140 @@
+import random
+
+import pytest
+from src.main.graph import Graph
+from src.main.algorithms import _csr, search
+from src.main.algorithms._kernels import HAVE_NUMBA
+from src.main.algorithms.search import (
+    breadth_first_search, depth_first_search, find_path_bfs, find_all_paths_dfs,
+    multi_source_distances, bfs_cached
+)
+
+
+@pytest.fixture(params=[False, True], ids=['python', 'numba'])
+def use_numba(request, monkeypatch):
+    """Run the test with and without the Numba kernels."""
+    if request.param and not HAVE_NUMBA:
+        pytest.skip("Numba is not installed")
+    monkeypatch.setattr(search, 'HAVE_NUMBA', request.param)
+
+
+def test_breadth_first_search(use_numba):
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(1, 3)
+    g.add_edge(2, 4)
+    g.add_edge(3, 4)
+    g.add_edge(4, 5)
+
+    result = breadth_first_search(g, 1)
+    assert result['visited_order'] == [1, 2, 3, 4, 5]
+    assert result['distances'] == {1: 0, 2: 1, 3: 1, 4: 2, 5: 3}
+    assert result['predecessors'][1] is None
+
+    with pytest.raises(KeyError):
+        breadth_first_search(g, 6)
+
+
+def test_depth_first_search(use_numba):
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.add_edge(1, 4)
+
+    result = depth_first_search(g, 1)
+    assert result['visited_order'] == [1, 2, 3, 4]
+    assert result['discovery_times'] == {1: 1, 2: 2, 3: 3, 4: 6}
+    assert result['finish_times'] == {3: 4, 2: 5, 4: 7, 1: 8}
+
+
+def test_direction_optimizing_bfs(monkeypatch):
+    # Large enough for the pure-Python search to switch strategies
+    rng = random.Random(0)
+    g = Graph()
+    for i in range(3000):
+        g.add_vertex(i)
+    for _ in range(20000):
+        u, v = rng.sample(range(3000), 2)
+        g.add_edge(u, v)
+
+    monkeypatch.setattr(search, 'HAVE_NUMBA', False)
+    result = breadth_first_search(g, 0)
+
+    monkeypatch.setattr(_csr, '_DIRECTION_OPTIMIZING_THRESHOLD', len(g))
+    expected = breadth_first_search(g, 0)
+
+    distances = result['distances']
+    assert distances == expected['distances']
+    assert [distances[v] for v in result['visited_order']] == sorted(distances.values())
+    for vertex, parent in result['predecessors'].items():
+        if parent is not None:
+            assert vertex in g.get_neighbors(parent)
+            assert distances[parent] == distances[vertex] - 1
+
+
+def test_long_chain():
+    # Deeper than the default recursion limit
+    g = Graph()
+    for i in range(5000):
+        g.add_edge(i, i + 1)
+
+    assert len(depth_first_search(g, 0)['visited_order']) == 5001
+    assert list(find_all_paths_dfs(g, 0, 5000)) == [list(range(5001))]
+
+
+def test_find_paths():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(1, 3)
+    g.add_edge(2, 4)
+    g.add_edge(3, 4)
+    g.add_vertex(5)
+
+    assert len(find_path_bfs(g, 1, 4)) == 3
+    assert find_path_bfs(g, 1, 5) is None
+    assert find_path_bfs(g, 1, 6) is None
+    assert sorted(find_all_paths_dfs(g, 1, 4)) == [[1, 2, 4], [1, 3, 4]]
+    assert len(list(find_all_paths_dfs(g, 1, 4, max_paths=1))) == 1
+    assert list(find_all_paths_dfs(g, 1, 4, max_depth=1)) == []
+    assert list(find_all_paths_dfs(g, 1, 1)) == [[1]]
+    with pytest.raises(KeyError):
+        find_all_paths_dfs(g, 1, 6)
+
+    # Cached searches must not outlive a modification
+    g.add_edge(4, 5)
+    assert find_path_bfs(g, 1, 5) is not None
+    g.remove_edge(2, 4)
+    assert find_path_bfs(g, 1, 4) == [1, 3, 4]
+
+
+def test_multi_source_distances(use_numba):
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.add_edge(3, 4)
+    g.add_edge(5, 6)
+
+    distances = multi_source_distances(g, [1, 3, 5])
+    for source in (1, 3, 5):
+        assert distances[source] == breadth_first_search(g, source)['distances']
+
+    with pytest.raises(KeyError):
+        multi_source_distances(g, [1, 7])
+
+
+def test_bfs_cached():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    first = bfs_cached(g, 1, cache_size=1)
+    assert first['distances'] == {1: 0, 2: 1, 3: 2}
+    assert bfs_cached(g, 1, cache_size=1) is first
+    bfs_cached(g, 2, cache_size=1)
+    assert bfs_cached(g, 1, cache_size=1) is not first
+    assert find_path_bfs(g, 1, 3) == [1, 2, 3]
+
+    g.add_edge(1, 3)
+    assert bfs_cached(g, 1)['distances'][3] == 1
+    assert find_path_bfs(g, 1, 3) == [1, 3]
+    assert find_path_bfs(g, 1, 4) is None
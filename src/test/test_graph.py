@@ -25,4 +25,67 @@ def test_get_neighbors():
     g.add_edge(1, 3)
     assert set(g.get_neighbors(1)) == {2, 3}
     with pytest.raises(KeyError):
-        g.get_neighbors(4)
\ No newline at end of file
+        g.get_neighbors(4)
+
+def test_vertex_ids():
+    g = Graph()
+    g.add_edge('a', 'b')
+    g.add_edge('b', 'c')
+    assert g.vertex_ids() == range(3)
+    b = g.get_vertex_id('b')
+    assert {g.get_vertex(i) for i in g.get_neighbors_ids(b)} == {'a', 'c'}
+
+    # Ids stay contiguous after a removal
+    g.remove_vertex('a')
+    assert g.vertex_ids() == range(2)
+    assert {g.get_vertex(i) for i in g.vertex_ids()} == {'b', 'c'}
+    assert list(g.get_neighbors_ids(g.get_vertex_id('c'))) == [g.get_vertex_id('b')]
+
+def test_get_edges():
+    g = Graph()
+    g.add_edge(2, 1)
+    g.add_edge(2, 3)
+    g.add_edge(3, 1)
+    assert sorted(g.get_edges()) == [(1, 2), (1, 3), (2, 3)]
+
+    # Vertices that cannot be compared are still listed once per edge
+    g.add_edge('a', 1)
+    assert len(g.get_edges()) == 4
+    assert {frozenset(e) for e in g.get_edges()} == {
+        frozenset({1, 2}), frozenset({1, 3}), frozenset({2, 3}), frozenset({'a', 1})
+    }
+
+def test_freeze():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(1, 3)
+    indptr, indices, vertex_to_id, id_to_vertex = g.freeze()
+    assert len(indptr) == len(g) + 1
+    assert len(indices) == 2 * g.size()
+    u = vertex_to_id[1]
+    assert {id_to_vertex[v] for v in indices[indptr[u]:indptr[u + 1]]} == {2, 3}
+
+    # The view is cached until the graph changes
+    assert g.freeze() is g.freeze()
+    g.add_edge(2, 3)
+    assert len(g.freeze()[1]) == 6
+
+def test_components():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(3, 4)
+    g.add_vertex(5)
+    assert g.num_components() == 3
+    assert g.same_component(1, 2)
+    assert not g.same_component(1, 3)
+
+    g.add_edge(2, 3)
+    assert g.num_components() == 2
+    assert g.same_component(1, 4)
+
+    # Removals are reflected once the components are rebuilt
+    g.remove_edge(2, 3)
+    assert not g.same_component(1, 4)
+    g.remove_vertex(5)
+    assert g.num_components() == 2
+    assert sorted(map(sorted, g.components())) == [[1, 2], [3, 4]]
@@ -0,0 +1,55 @@
+import matplotlib
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import networkx as nx
+import pytest
+from src.main.graph import Graph
+from src.main.visualization.plot import visualize_graph, visualize_path
+
+
+@pytest.fixture
+def graph():
+    g = Graph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    plt.close('all')
+    yield g
+    plt.close('all')
+
+
+def test_savefig(graph, tmp_path):
+    path = tmp_path / "graph.png"
+    visualize_graph(graph, savefig=str(path))
+    assert path.exists()
+    assert plt.get_fignums() == []
+
+
+def test_existing_ax(graph):
+    fig, ax = plt.subplots()
+    visualize_path(graph, [1, 2, 3], ax=ax)
+    assert plt.get_fignums() == [fig.number]
+    assert ax.collections
+
+
+def test_precomputed_layout(graph, tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("layout should not be computed")
+
+    monkeypatch.setattr(nx, 'spring_layout', fail)
+    layout = {1: (0, 0), 2: (1, 0), 3: (2, 0)}
+    visualize_graph(graph, layout=layout, savefig=str(tmp_path / "graph.png"))
+    assert graph._nx_cache[2] is None
+
+
+def test_cache_invalidated(graph, tmp_path):
+    path = str(tmp_path / "graph.png")
+    visualize_graph(graph, savefig=path)
+    G, pos = graph._nx_cache[1], graph._nx_cache[2]
+    visualize_graph(graph, savefig=path)
+    assert graph._nx_cache[1] is G and graph._nx_cache[2] is pos
+
+    graph.add_edge(3, 4)
+    visualize_graph(graph, savefig=path)
+    assert graph._nx_cache[1] is not G
+    assert 4 in graph._nx_cache[1] and 4 in graph._nx_cache[2]